@@ -79,6 +79,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: RinnaiConfigEntry) -> bo
     if not coordinator.data.get("devices"):
         raise ConfigEntryNotReady("No devices found")
 
+    # Restore persisted energy data once, now that devices exist
+    await coordinator.async_load_energy_data()
+
     device_count = len(coordinator.data["devices"])
     _LOGGER.info(
         "Rinnai integration ready: %d device(s) — %s",
@@ -112,6 +115,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: RinnaiConfigEntry) -> b
 
     if unload_ok:
         coordinator: RinnaiCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Flushes any pending debounced energy save before the client closes
+        await coordinator.async_shutdown()
         await coordinator.client.async_close()
 
     return unload_ok
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -18,10 +19,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
 from .coordinator import RinnaiCoordinator
 from .entity import RinnaiEntity
-from .core.entity_utils import execute_transition, resolve_mode_code
+from .core.entity_utils import execute_transition, get_state_value
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared across all instances; HA reads but does not mutate this list.
+_HVAC_MODES = [HVACMode.HEAT, HVACMode.OFF]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,18 +35,20 @@ async def async_setup_entry(
     """Set up Rinnai climate based on a config entry."""
     coordinator: RinnaiCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
+    # async_add_entities accepts any iterable; stream entities instead of
+    # building an intermediate list.
+    async_add_entities(_iter_climate_entities(coordinator))
+
+
+def _iter_climate_entities(coordinator: RinnaiCoordinator):
+    """Yield climate entities for every configured device."""
     for device_id in coordinator.data["devices"]:
         device = coordinator.get_device(device_id)
         if not device or not device.config:
             continue
-            
-        if climate_configs := device.config.entities.get("climate"):
-            for config in climate_configs:
-                entities.append(RinnaiHeatingClimateEntity(coordinator, device_id, config))
 
-    _LOGGER.debug("Setting up %d climate entities", len(entities))
-    async_add_entities(entities)
+        for config in device.config.entities.get("climate") or ():
+            yield RinnaiHeatingClimateEntity(coordinator, device_id, config)
 
 
 class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
@@ -58,15 +64,18 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         
         # Mandatory configuration
-        self._attr_min_temp = config["min_temp"]
-        self._attr_max_temp = config["max_temp"]
+        self._configured_min_temp = config["min_temp"]
+        self._configured_max_temp = config["max_temp"]
+        self._attr_min_temp = self._configured_min_temp
+        self._attr_max_temp = self._configured_max_temp
         self._attr_target_temperature_step = config["step"]
         
         self._modes_config = config["modes"]
         self._transitions = config["transitions"]
         self._mode_codes = config["mode_codes"]
         self._temp_settings = config["temp_settings"]
-        self._active_states = config["active_states"]
+        # frozenset for O(1) membership tests on every update
+        self._active_states = frozenset(str(state) for state in config["active_states"])
         self._mode_match = config.get("mode_match", "exact")
         
         # Defaults config
@@ -75,28 +84,114 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
         self._on_mode = defaults.get("on_mode", "normal")
         self._action_attribute = defaults.get("action_attribute", "burning_state")
         
-        # Build preset modes list (excluding off mode)
-        self._attr_preset_modes = []
-        for mode_key, mode_data in self._modes_config.items():
-            if mode_key != self._off_mode:
-                self._attr_preset_modes.append(mode_data.get("label"))
+        # Per-mode temperature plan so _update_temperature_attributes does a
+        # single dict lookup instead of re-checking "fixed"/"read" membership.
+        temp_plan: dict[str, tuple[str, Any]] = {}
+        for mode_key, temp_config in self._temp_settings.items():
+            if "fixed" in temp_config:
+                temp_plan[mode_key] = ("fixed", temp_config["fixed"])
+            elif "read" in temp_config:
+                temp_plan[mode_key] = ("read", temp_config["read"])
+            elif temp_config:
+                # e.g. write-only modes: leave the target temperature as-is
+                temp_plan[mode_key] = ("keep", None)
+        self._temp_plan = MappingProxyType(temp_plan)
+
+        # Exact-match reverse table for O(1) code -> mode key resolution;
+        # setdefault preserves resolve_mode_code's first-match semantics if a
+        # code is listed under several modes. Prefix matching still scans.
+        code_to_mode: dict[str, str] = {}
+        for mode_key, codes in self._mode_codes.items():
+            for code in codes:
+                code_to_mode.setdefault(str(code).upper(), mode_key)
+        self._code_to_mode = MappingProxyType(code_to_mode)
+
+        # Prefix matching still scans, but over candidate tuples normalized
+        # here once instead of re-uppercased on every resolution.
+        self._prefix_code_table = tuple(
+            (mode_key, tuple(str(code).upper() for code in codes))
+            for mode_key, codes in self._mode_codes.items()
+        )
+
+        # Forward and reverse label maps so the update and preset paths do a
+        # single flat lookup instead of a nested modes-config traversal
+        self._mode_labels = MappingProxyType({
+            mode_key: mode_data.get("label")
+            for mode_key, mode_data in self._modes_config.items()
+        })
+        self._label_to_mode = MappingProxyType({
+            label: mode_key for mode_key, label in self._mode_labels.items()
+        })
+
+        # Preset modes list derived from the same map (excluding off mode)
+        self._attr_preset_modes = [
+            label
+            for label, mode_key in self._label_to_mode.items()
+            if mode_key != self._off_mode
+        ]
 
-        self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
+        self._attr_hvac_modes = _HVAC_MODES
         
         # Current internal mode key
         self._current_mode = self._off_mode
 
+        # Resolve the raw-data key for operation_mode once; reading it is the
+        # first step of every update, so skip the mapping fallback chain there.
+        device = self._device
+        state_mapping = device.config.state_mapping if device and device.config else {}
+        self._operation_mode_key = state_mapping.get("operation_mode", "operation_mode")
+
+        # Raw state attributes that feed the visible attributes; used to skip
+        # rebuilding them when a coordinator tick changed nothing relevant.
+        read_attrs = tuple(
+            temp_config["read"]
+            for temp_config in self._temp_settings.values()
+            if "read" in temp_config
+        )
+        self._signature_attrs = ("operation_mode", self._action_attribute, *read_attrs)
+        self._last_signature: tuple | None = None
+
         self._update_attributes()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._update_attributes()
-        self.async_write_ha_state()
+        signature = self._state_signature()
+        if signature is not None and signature == self._last_signature:
+            return
+        self._last_signature = signature
+        if self._update_attributes():
+            self.async_write_ha_state()
+
+    def _state_signature(self) -> tuple | None:
+        """Build a change-detection tuple from the raw device state."""
+        device = self._device
+        if not device:
+            return None
+        state = self._device_state
+        mapping = device.config.state_mapping if device.config else None
+        # available folds in device.online and super().available, so a failed
+        # or recovered coordinator refresh changes the signature too
+        return (
+            self.available,
+            *(get_state_value(state, attr, mapping) for attr in self._signature_attrs),
+        )
 
     def _get_mode_from_code(self, code: str) -> str:
         """Resolve mode key from operation mode code."""
-        if mode_key := resolve_mode_code(code, self._mode_codes, self._mode_match):
+        if self._mode_match == "exact":
+            mode_key = self._code_to_mode.get(str(code).upper())
+        else:
+            normalized = str(code).upper()
+            mode_key = None
+            for key, candidates in self._prefix_code_table:
+                if any(
+                    candidate and normalized.startswith(candidate)
+                    for candidate in candidates
+                ):
+                    mode_key = key
+                    break
+        if mode_key:
             return mode_key
         _LOGGER.debug(
             "Device %s: unknown operation mode code '%s', defaulting to '%s'",
@@ -104,38 +199,55 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
         )
         return self._off_mode
 
-    def _update_temperature_attributes(self) -> None:
+    def _update_temperature_attributes(self, state, mapping) -> None:
         """Update temperature attributes based on current mode."""
         # Reset min/max to defaults
-        self._attr_min_temp = self._entity_config["min_temp"]
-        self._attr_max_temp = self._entity_config["max_temp"]
-        
-        temp_config = self._temp_settings.get(self._current_mode)
-        if not temp_config:
+        self._attr_min_temp = self._configured_min_temp
+        self._attr_max_temp = self._configured_max_temp
+
+        plan = self._temp_plan.get(self._current_mode)
+        if plan is None:
             # Fallback
-            self._attr_target_temperature = self.get_state_value("heating_temp_nm")
+            self._attr_target_temperature = get_state_value(state, "heating_temp_nm", mapping)
             return
-            
-        if "fixed" in temp_config:
-            fixed_temp = temp_config["fixed"]
-            self._attr_target_temperature = fixed_temp
-            self._attr_min_temp = fixed_temp
-            self._attr_max_temp = fixed_temp
-        elif "read" in temp_config:
-            read_attr = temp_config["read"]
-            self._attr_target_temperature = self.get_state_value(read_attr)
-
-    def _update_attributes(self) -> None:
-        """Update entity attributes based on coordinator data."""
+
+        kind, value = plan
+        if kind == "fixed":
+            self._attr_target_temperature = value
+            self._attr_min_temp = value
+            self._attr_max_temp = value
+        elif kind == "read":
+            self._attr_target_temperature = get_state_value(state, value, mapping)
+
+    def _visible_attributes(self) -> tuple:
+        """Snapshot the attributes that affect the written state."""
+        return (
+            getattr(self, "_attr_available", None),
+            getattr(self, "_attr_hvac_mode", None),
+            getattr(self, "_attr_hvac_action", None),
+            getattr(self, "_attr_preset_mode", None),
+            getattr(self, "_attr_target_temperature", None),
+            getattr(self, "_attr_min_temp", None),
+            getattr(self, "_attr_max_temp", None),
+        )
+
+    def _update_attributes(self) -> bool:
+        """Update entity attributes; return True if a visible attribute changed."""
+        before = self._visible_attributes()
         device = self._device
         if not device:
             self._attr_available = False
-            return
+            return self._visible_attributes() != before
 
         self._attr_available = device.online
 
+        # Resolve state and mapping once; get_state_value re-resolves both
+        # through the coordinator on every call otherwise.
+        state = self._device_state
+        mapping = device.config.state_mapping if device.config else None
+
         # Get current operation mode
-        mode_code = self.get_state_value("operation_mode")
+        mode_code = state.raw_data.get(self._operation_mode_key) if state else None
         self._current_mode = self._get_mode_from_code(str(mode_code))
         
         # Set preset & HVAC mode
@@ -146,20 +258,19 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
         else:
             self._attr_hvac_mode = HVACMode.HEAT
             
-            # Set preset mode label
-            mode_data = self._modes_config.get(self._current_mode)
-            if mode_data:
-                self._attr_preset_mode = mode_data.get("label")
+            # Set preset mode label (every resolvable mode key has an entry)
+            self._attr_preset_mode = self._mode_labels.get(self._current_mode)
             
             # Determine action
-            burning_state = str(self.get_state_value(self._action_attribute))
+            burning_state = str(get_state_value(state, self._action_attribute, mapping))
             if burning_state in self._active_states:
                 self._attr_hvac_action = HVACAction.HEATING
             else:
                 self._attr_hvac_action = HVACAction.IDLE
 
-        self._update_temperature_attributes()
+        self._update_temperature_attributes(state, mapping)
         self._attr_current_temperature = self._attr_target_temperature
+        return self._visible_attributes() != before
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -176,7 +287,7 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
             return
 
         write_cmd = temp_config["write"]
-        hex_temperature = hex(temperature)[2:].upper()
+        hex_temperature = f"{temperature:X}"
         command = {write_cmd: hex_temperature}
         
         success = await self.coordinator.async_send_command(self._device_id, command)
@@ -199,12 +310,7 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        target_mode = None
-        for mode_key, mode_data in self._modes_config.items():
-            if mode_data.get("label") == preset_mode:
-                target_mode = mode_key
-                break
-                
+        target_mode = self._label_to_mode.get(preset_mode)
         if target_mode:
             await self._perform_transition(target_mode)
 
@@ -223,10 +329,11 @@ class RinnaiHeatingClimateEntity(RinnaiEntity, ClimateEntity):
         _LOGGER.debug("Executing transition: %s", transition_key)
         
         if await execute_transition(self.coordinator, self._device_id, steps):
+            # Optimistic state is already applied by async_send_command; the
+            # device confirms via MQTT push, so no full refresh is needed here.
             self._current_mode = target_mode
             self._update_attributes()
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
         else:
             _LOGGER.warning(
                 "Device %s: transition '%s' failed (command send error)",
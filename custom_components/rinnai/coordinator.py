@@ -1,6 +1,7 @@
 """Data update coordinator for Rinnai integration."""
 from __future__ import annotations
 
+import asyncio
 import datetime
 from datetime import timedelta
 import logging
@@ -23,6 +24,9 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.energy_data"
 
+# Coalesce energy-data storage writes triggered by chatty MQTT updates
+ENERGY_SAVE_DEBOUNCE = 30  # seconds
+
 
 class RinnaiCoordinator(DataUpdateCoordinator):
     """Data update coordinator for Rinnai devices."""
@@ -34,6 +38,11 @@ class RinnaiCoordinator(DataUpdateCoordinator):
         update_interval: int = 300,
     ) -> None:
         """Initialize the coordinator."""
+        # always_update stays at its True default: self.data is one stable
+        # dict mutated in place (see below), so HA's previous_data !=
+        # self.data comparison could never observe a poll-time change and
+        # always_update=False would silence scheduled refreshes entirely.
+        # Per-entity signature guards keep the listener fan-out cheap.
         super().__init__(
             hass,
             _LOGGER,
@@ -44,13 +53,25 @@ class RinnaiCoordinator(DataUpdateCoordinator):
         self._first_update = True
         self._devices: dict[str, RinnaiDevice] = {}
         self._last_http_update: dict[str, float] = {}
-        self.data = {"devices": {}, "device_states": {}}
+        # One stable data dict for the coordinator's lifetime: "devices" and
+        # the raw_* entries alias live dicts, "device_states" is refreshed in
+        # place. Entities holding a reference always see current state and
+        # each update tick skips rebuilding the container.
+        self.data = {
+            "devices": self._devices,
+            "device_states": {},
+            "raw_devices": client.devices,
+            "raw_device_states": client.device_states,
+        }
 
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        self._energy_data_loaded = False
+        self._energy_cache: dict[str, dict] = {}  # last data handed to the store
+        self._energy_save_handle = None
         self._last_consumption_fetch: dict[str, float] = {}  # device_id → timestamp
+        self._last_state_payload: dict[str, dict] = {}  # device_id → last processed copy
+        self._device_info_cache: dict[str, dict] = {}
 
-    async def _load_energy_data(self) -> None:
+    async def async_load_energy_data(self) -> None:
         """Load saved energy data from storage."""
         try:
             if saved_data := await self._store.async_load():
@@ -61,30 +82,59 @@ class RinnaiCoordinator(DataUpdateCoordinator):
         except (ValueError, TypeError, KeyError) as err:
             _LOGGER.error("Error loading energy data: %s", err)
 
+    def _schedule_save_energy_data(self) -> None:
+        """Schedule a debounced energy-data save.
+
+        Energy pushes can arrive with every MQTT state update; writing the
+        store each time amplifies one small change into a full JSON encode and
+        disk write. Arm a single timer instead and let it coalesce all updates
+        that land within the window.
+        """
+        if self._energy_save_handle is not None:
+            return
+
+        def _fire() -> None:
+            self._energy_save_handle = None
+            self.hass.create_task(self._save_energy_data())
+
+        self._energy_save_handle = self.hass.loop.call_later(
+            ENERGY_SAVE_DEBOUNCE, _fire
+        )
+
     async def _save_energy_data(self) -> None:
         """Save energy data to storage."""
         try:
-            energy_data = {}
+            # Reuse one top-level dict across saves and only swap in per-device
+            # entries that actually changed — unchanged devices keep their
+            # existing sub-dict instead of getting a fresh copy every save
+            energy_data = self._energy_cache
             for device_id, device in self._devices.items():
                 if not device.config:
                     continue
-                    
-                # Get energy keys from config features
-                energy_keys = device.config.features.get("energy_data_keys", [])
-                device_energy = {}
-                
-                for key in energy_keys:
-                    if key in device.state.raw_data:
-                        device_energy[key] = device.state.raw_data[key]
-                
-
-                energy_data[device_id] = device_energy
+
+                # Get energy keys from config features; bind raw_data locally
+                # and build the dict in one C-level comprehension
+                energy_keys = device.config.energy_keys
+                raw_data = device.state.raw_data
+                entry = {
+                    key: raw_data[key] for key in energy_keys if key in raw_data
+                }
+                if entry != energy_data.get(device_id):
+                    energy_data[device_id] = entry
 
             await self._store.async_save(energy_data)
             _LOGGER.debug("Saved energy data for all devices")
         except (ValueError, TypeError, KeyError) as err:
             _LOGGER.error("Error saving energy data: %s", err)
 
+    async def async_shutdown(self) -> None:
+        """Flush a pending debounced energy save before shutting down."""
+        if self._energy_save_handle is not None:
+            self._energy_save_handle.cancel()
+            self._energy_save_handle = None
+            await self._save_energy_data()
+        await super().async_shutdown()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via API."""
 
@@ -102,50 +152,68 @@ class RinnaiCoordinator(DataUpdateCoordinator):
                 if not await self.client.fetch_devices():
                     _LOGGER.warning("Failed to fetch devices from HTTP API")
 
-                for device_id in self.client.devices:
-                    _LOGGER.debug("Fetching initial state for device: %s", device_id)
-                    if not await self.client.fetch_device_state(device_id):
+                # Snapshot the ids once: MQTT callbacks may mutate the client's
+                # dict across the awaits below, and the tuple is reused for the
+                # gather, the result pass and the schedule refresh
+                device_ids = tuple(self.client.devices)
+                results = await asyncio.gather(
+                    *(self.client.fetch_device_state(d) for d in device_ids)
+                )
+                for device_id, ok in zip(device_ids, results):
+                    if not ok:
                         _LOGGER.warning("Failed to fetch state for device: %s", device_id)
 
                 self._first_update = False
                 self._process_devices_data()
-                
-                for device_id in self.client.devices:
+
+                for device_id in device_ids:
                     await self.async_refresh_schedule(device_id)
             else:
                 _LOGGER.debug("Skipping HTTP device fetch, using MQTT data only")
                 current_time = time.time()
-                for device_id in self.client.devices:
-                    device_state = self.client.device_states.get(device_id, {})
-                    if (not device_state or 
-                        getattr(self, "_last_http_update", {}).get(device_id, 0) < current_time - 3600):
-                        _LOGGER.debug("Fetching HTTP state update for device: %s", device_id)
-                        if await self.client.fetch_device_state(device_id):
+                # _last_http_update is always set in __init__, so bind it (and
+                # the staleness threshold) once instead of re-resolving per device
+                last_http_update = self._last_http_update
+                threshold = current_time - 3600
+                device_ids = tuple(self.client.devices)
+                stale_ids = [
+                    device_id
+                    for device_id in device_ids
+                    if (not self.client.device_states.get(device_id) or
+                        last_http_update.get(device_id, 0) < threshold)
+                ]
+                if stale_ids:
+                    _LOGGER.debug("Fetching HTTP state update for devices: %s", stale_ids)
+                    results = await asyncio.gather(
+                        *(self.client.fetch_device_state(d) for d in stale_ids)
+                    )
+                    for device_id, ok in zip(stale_ids, results):
+                        if ok:
                             self._last_http_update[device_id] = current_time
 
                 self._process_device_states()
 
-            # Fetch consumption data for all applicable devices (throttled to once per hour)
+            # Fetch consumption data for all applicable devices (throttled to
+            # once per 6 hours). This slow-changing data runs as a background
+            # task so the three HTTP requests per device never block the fast
+            # MQTT-driven state path.
             current_time = time.time()
             for device_id in self._devices:
                 last = self._last_consumption_fetch.get(device_id, 0)
                 if current_time - last >= 21600:
-                    await self._fetch_consumption_data(device_id)
                     self._last_consumption_fetch[device_id] = current_time
+                    self.hass.create_task(self._fetch_consumption_data(device_id))
 
             self._log_device_states()
 
         except (ValueError, TypeError, KeyError) as err:
             handle_error(f"Error updating Rinnai data: {err}")
 
-        return {
-            "devices": self._devices,
-            "device_states": {
-                device_id: device.state for device_id, device in self._devices.items()
-            },
-            "raw_devices": self.client.devices,
-            "raw_device_states": self.client.device_states,
-        }
+        device_states = self.data["device_states"]
+        device_states.clear()
+        for device_id, device in self._devices.items():
+            device_states[device_id] = device.state
+        return self.data
 
     def _process_devices_data(self) -> None:
         """Process devices data from client into structured format."""
@@ -164,17 +232,21 @@ class RinnaiCoordinator(DataUpdateCoordinator):
                     self.client.device_states[device_id], is_command=False
                 )
 
-        if not self._energy_data_loaded:
-            self.hass.create_task(self._load_energy_data())
-            self._energy_data_loaded = True
-
     def _process_device_states(self) -> None:
         """Process device states from client into structured format."""
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         for device_id, state_data in self.client.device_states.items():
             if device_id in self._devices:
-                _LOGGER.debug("Received state data from client: %s: %s", device_id, state_data)
+                # Rinnai re-sends identical payloads frequently; one dict
+                # compare is far cheaper than re-running the state manager
+                # and processor chains for an update that changes nothing
+                if state_data == self._last_state_payload.get(device_id):
+                    continue
+                self._last_state_payload[device_id] = dict(state_data)
+                if debug_enabled:
+                    _LOGGER.debug("Received state data from client: %s: %s", device_id, state_data)
                 self._devices[device_id].update_state(state_data, is_command=False)
-                self.hass.create_task(self._save_energy_data())
+                self._schedule_save_energy_data()
             else:
                 _LOGGER.warning("Received state for unknown device %s, fetching device info", device_id)
                 self._process_devices_data()
@@ -209,16 +281,17 @@ class RinnaiCoordinator(DataUpdateCoordinator):
 
         # Save energy data when an energy update arrives (stg/ topic keys present)
         device = self._devices[device_id]
-        if device.config:
-            energy_keys = device.config.features.get("energy_data_keys", [])
-            if any(k in data for k in energy_keys):
-                self.hass.create_task(self._save_energy_data())
+        if device.config and device.config.energy_keys & data.keys():
+            self._schedule_save_energy_data()
 
     async def async_send_command(self, device_id: str, command: dict[str, Any]) -> bool:
         """Send command to a device."""
         result = await self.client.send_command(device_id, command)
 
         if result and device_id in self._devices:
+            # Force the next poll to reprocess even an unchanged payload so an
+            # expired optimistic value is reconciled against the remote state
+            self._last_state_payload.pop(device_id, None)
             self._devices[device_id].update_state(command, is_command=True)
             self.async_set_updated_data(self.data)
             self.data["device_states"][device_id] = self._devices[device_id].state
@@ -253,6 +326,27 @@ class RinnaiCoordinator(DataUpdateCoordinator):
         """Get device by ID."""
         return self._devices.get(device_id)
 
+    def device_info_for(self, device_id: str) -> dict | None:
+        """Return the shared device_info dict for a device.
+
+        Every entity of one device carries identical device_info; building it
+        once and handing out the same dict avoids one dict + identifier-set
+        allocation per entity at setup.
+        """
+        if (info := self._device_info_cache.get(device_id)) is not None:
+            return info
+        device = self._devices.get(device_id)
+        if not device:
+            return None
+        info = {
+            "identifiers": {(DOMAIN, device_id)},
+            "name": device.device_name,
+            "manufacturer": "Rinnai",
+            "model": device.device_type,
+        }
+        self._device_info_cache[device_id] = info
+        return info
+
     def get_device_state(self, device_id: str) -> RinnaiDeviceState | None:
         """Get device state by ID."""
         device = self.get_device(device_id)
@@ -309,6 +403,8 @@ class RinnaiCoordinator(DataUpdateCoordinator):
             _LOGGER.debug(
                 "Consumption data for device %s: %s", device_id, updates
             )
+            # Runs outside _async_update_data now, so notify listeners here
+            self.async_set_updated_data(self.data)
 
     async def _inject_daily_statistics(self, device_id: str, values: list) -> None:
         """Inject daily gas consumption history into HA long-term statistics."""
@@ -375,5 +471,7 @@ class RinnaiCoordinator(DataUpdateCoordinator):
 
     def _log_device_states(self) -> None:
         """Log detailed state information for all devices."""
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
         for device_id, device in self._devices.items():
             _LOGGER.debug("Device %s (%s) - Online: %s", device.device_name, device_id, device.online)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import partial
 import hashlib
 import json
 import logging
@@ -32,6 +33,25 @@ from .mqtt_client import RinnaiMQTTClient
 
 _LOGGER = logging.getLogger(__name__)
 
+_PROTOCOL = MQTT_DEFINITIONS["protocol"]
+
+# QoS policy: telemetry (inf/stg/sys/res) is re-published periodically by the
+# device, so QoS 0 avoids a PUBACK round-trip per frame; commands must arrive,
+# so they stay at QoS 1.
+TELEMETRY_QOS = 0
+COMMAND_QOS = 1
+
+# Fixed command-message fields, hoisted so send_command only fills in the
+# per-command keys instead of rebuilding the constant part each call
+_COMMAND_TEMPLATE = {
+    "ptn": _PROTOCOL["command_pattern"],
+    "sum": _PROTOCOL["command_sum"],
+}
+
+# One global + one attribute lookup saved on every inbound frame
+# (json.loads takes bytes directly)
+_json_loads = json.loads
+
 
 class RinnaiClient:
     """Unified client for interacting with Rinnai devices."""
@@ -47,16 +67,15 @@ class RinnaiClient:
         """Initialize the unified Rinnai client."""
         self.hass = hass
         self.username = username
-        # MD5 hash for HTTP API
-        self.password_hash = str.upper(
-            hashlib.md5(password.encode("utf-8")).hexdigest()
-        )
+        # MD5 hash for HTTP API (also the MQTT password), computed once
+        self.password_hash = hashlib.md5(password.encode("utf-8")).hexdigest().upper()
         self.connect_timeout = connect_timeout
         self.update_interval = update_interval
 
         # HTTP session
         self._session = async_get_clientsession(hass)
         self._token: str | None = None
+        self._auth_headers: dict[str, str] | None = None
         self._lock = asyncio.Lock()
         self._last_login_time = 0
 
@@ -74,15 +93,27 @@ class RinnaiClient:
         # Track MQTT subscriptions
         self._mqtt_subscriptions: dict[str, Callable[[], None]] = {}
 
+        # Per-device MQTT topic caches, kept on the client so internals never
+        # leak into the raw API device dicts (which entities and the
+        # coordinator expose as raw data)
+        self._set_topics: dict[str, str] = {}
+        self._sub_topic_tables: dict[str, tuple[tuple[str, str], ...]] = {}
+
         # Track initialization status
         self._initialized = False
 
     def _http_headers(self, *, authenticated: bool = False) -> dict[str, str]:
         """Build headers accepted by the Rinnai API gateway."""
-        headers = dict(API_HEADERS)
-        if authenticated:
+        if not authenticated:
+            return dict(API_HEADERS)
+
+        # The authenticated header set only changes when the token does, so
+        # build it once per login instead of once per request
+        if self._auth_headers is None:
+            headers = dict(API_HEADERS)
             headers["Authorization"] = f"Basic {self._token}"
-        return headers
+            self._auth_headers = headers
+        return self._auth_headers
 
     def register_callback(
         self, device_id: str, callback_func: Callable[[dict[str, Any]], None]
@@ -144,13 +175,14 @@ class RinnaiClient:
                     }
 
                     url = f"{BASE_URL}{API_DEFINITIONS['login']['url']}"
-                    response = await self._session.get(
+                    # async with releases the connection back to the pool as
+                    # soon as the body is read, keeping keep-alive effective
+                    async with self._session.get(
                         url,
                         params=login_data,
                         headers=self._http_headers(),
-                    )
-
-                    resp_json = await response.json()
+                    ) as response:
+                        resp_json = await response.json()
                     if resp_json.get("success") is not True:
                         _LOGGER.error(
                             "Failed to login to Rinnai: %s",
@@ -159,6 +191,7 @@ class RinnaiClient:
                         return False
 
                     self._token = resp_json.get("data", {}).get("token")
+                    self._auth_headers = None  # rebuilt lazily for the new token
                     self._last_login_time = time.time()
                     return True
             except aiohttp.ContentTypeError as err:
@@ -187,8 +220,8 @@ class RinnaiClient:
             async with asyncio.timeout(self.connect_timeout):
                 headers = self._http_headers(authenticated=True)
                 url = f"{BASE_URL}{API_DEFINITIONS['device_list']['url']}"
-                response = await self._session.get(url, headers=headers)
-                resp_json = await response.json()
+                async with self._session.get(url, headers=headers) as response:
+                    resp_json = await response.json()
 
                 if resp_json.get("success") is not True:
                     _LOGGER.error(
@@ -236,12 +269,12 @@ class RinnaiClient:
             async with asyncio.timeout(self.connect_timeout):
                 headers = self._http_headers(authenticated=True)
                 url = f"{BASE_URL}{API_DEFINITIONS['device_state']['url']}"
-                response = await self._session.get(
+                async with self._session.get(
                     url,
                     params={"deviceId": device_id},
                     headers=headers,
-                )
-                resp_json = await response.json()
+                ) as response:
+                    resp_json = await response.json()
 
                 if resp_json.get("success") is not True:
                     _LOGGER.error(
@@ -251,7 +284,12 @@ class RinnaiClient:
                     )
                     return False
 
-                self.device_states[device_id] = resp_json.get("data", {})
+                # Merge instead of replace: the dict may already hold fields
+                # delivered over MQTT since the last poll, and downstream
+                # holders of the reference keep seeing the same object
+                self.device_states.setdefault(device_id, {}).update(
+                    resp_json.get("data") or {}
+                )
                 return True
 
         except (TimeoutError, aiohttp.ClientError) as err:
@@ -337,14 +375,15 @@ class RinnaiClient:
                 headers = self._http_headers(authenticated=True)
                 
                 if method == "GET":
-                    response = await self._session.get(url, params=final_params, headers=headers)
+                    request = self._session.get(url, params=final_params, headers=headers)
                 elif method == "POST":
-                    response = await self._session.post(url, data=final_data, headers=headers)
+                    request = self._session.post(url, data=final_data, headers=headers)
                 else:
                     _LOGGER.error("Unsupported method %s", method)
                     return None
 
-                resp_json = await response.json()
+                async with request as response:
+                    resp_json = await response.json()
                 
                 if resp_json.get("success") is not True:
                     _LOGGER.error(
@@ -401,86 +440,103 @@ class RinnaiClient:
             if not await self._mqtt_client.async_connect():
                 return
 
-        device_mac = self.devices.get(device_id, {}).get("mac")
+        device_data = self.devices.get(device_id, {})
+        device_mac = device_data.get("mac")
         if not device_mac:
             return
 
+        # Precompute the publish topic once; send_command reads the cached value
+        self._set_topics[device_id] = MQTT_DEFINITIONS["topics"]["set"].format(
+            mac=device_mac
+        )
 
-        topics = {
-            "inf": MQTT_DEFINITIONS["topics"]["info"].format(mac=device_mac),
-            "stg": MQTT_DEFINITIONS["topics"]["energy"].format(mac=device_mac),
-            "sys": MQTT_DEFINITIONS["topics"]["sys"].format(mac=device_mac),
-            "res": MQTT_DEFINITIONS["topics"]["res"].format(mac=device_mac),
-        }
+        # Format the subscription topics once per device; reconnect-time
+        # setups reuse the cached table instead of re-running the f-strings
+        sub_topics = self._sub_topic_tables.get(device_id)
+        if sub_topics is None:
+            sub_topics = tuple(
+                (topic_type, MQTT_DEFINITIONS["topics"][name].format(mac=device_mac))
+                for topic_type, name in (
+                    ("inf", "info"),
+                    ("stg", "energy"),
+                    ("sys", "sys"),
+                    ("res", "res"),
+                )
+            )
+            self._sub_topic_tables[device_id] = sub_topics
 
-        proto = MQTT_DEFINITIONS["protocol"]
+        for topic_type, topic in sub_topics:
+            subscription = await self._mqtt_client.async_subscribe(
+                topic,
+                partial(self._on_mqtt_message, device_id, topic_type),
+                qos=TELEMETRY_QOS,
+            )
+            self._mqtt_subscriptions[f"{device_id}_{topic_type}"] = subscription
 
-        for topic_type, topic in topics.items():
-            @callback
-            def message_received(msg, topic_type=topic_type, device_id=device_id):
-                try:
-                    payload = json.loads(msg.payload)
-
-                    if topic_type == "inf" and payload.get("enl"):
-                        code = payload.get("code")
-                        if code == proto["reservation_code"]:
-                            state_data = self._process_reservation_info(payload)
-                        elif code == proto["info_code"]:
-                            state_data = self._process_device_info(payload)
+    @callback
+    def _on_mqtt_message(self, device_id: str, topic_type: str, msg) -> None:
+        """Handle one inbound MQTT frame for a device topic."""
+        proto = _PROTOCOL
+        try:
+            payload = _json_loads(msg.payload)
+
+            if topic_type == "inf" and payload.get("enl"):
+                code = payload.get("code")
+                if code == proto["reservation_code"]:
+                    state_data = self._process_reservation_info(payload)
+                elif code == proto["info_code"]:
+                    state_data = self._process_device_info(payload)
+                else:
+                    config = self._device_configs.get(device_id)
+                    dynamic_code = None
+                    if is_dynamic_mqtt_code_enabled(config):
+                        dynamic_code = normalize_dynamic_mqtt_code(
+                            code,
+                            {
+                                "0",
+                                proto["info_code"],
+                                proto["reservation_code"],
+                            },
+                        )
+                    if dynamic_code:
+                        candidate_state = self._process_device_info(payload)
+                        known_fields = set(config.state_mapping.values())
+                        if known_fields.intersection(candidate_state):
+                            self.devices[device_id]["authCode"] = dynamic_code
+                            state_data = candidate_state
                         else:
-                            config = self._device_configs.get(device_id)
-                            dynamic_code = None
-                            if is_dynamic_mqtt_code_enabled(config):
-                                dynamic_code = normalize_dynamic_mqtt_code(
-                                    code,
-                                    {
-                                        "0",
-                                        proto["info_code"],
-                                        proto["reservation_code"],
-                                    },
-                                )
-                            if dynamic_code:
-                                candidate_state = self._process_device_info(payload)
-                                known_fields = set(config.state_mapping.values())
-                                if known_fields.intersection(candidate_state):
-                                    self.devices[device_id]["authCode"] = dynamic_code
-                                    state_data = candidate_state
-                                else:
-                                    state_data = {}
-                            else:
-                                state_data = {}
-                        if state_data:
-                            self._handle_state_update(device_id, state_data)
-                    elif topic_type == "stg":
-                        if payload.get("egy") and payload.get("ptn") == proto["energy_pattern"]:
-                            state_data = self._process_energy_data(payload, device_id)
-                            if state_data:
-                                self._handle_state_update(device_id, state_data)
-                    elif topic_type == "sys":
-                        ptn = payload.get("ptn")
-                        if ptn == proto["online_pattern"]:
-                            # Device online/offline notification
-                            is_online = payload.get("online") == "1"
-                            _LOGGER.debug(
-                                "Device %s online status: %s", device_id, is_online
-                            )
-                            self._handle_state_update(
-                                device_id, {"_online": is_online}
-                            )
-                        elif ptn == proto["heartbeat_pattern"]:
-                            _LOGGER.debug("Heartbeat received for device %s", device_id)
-                    elif topic_type == "res":
-                        # Response to an active get/ query (same ENL format as inf/)
-                        if payload.get("enl"):
-                            state_data = self._process_device_info(payload)
-                            if state_data:
-                                self._handle_state_update(device_id, state_data)
-
-                except Exception as err:
-                    _LOGGER.error("Error processing MQTT message: %s", err)
+                            state_data = {}
+                    else:
+                        state_data = {}
+                if state_data:
+                    self._handle_state_update(device_id, state_data)
+            elif topic_type == "stg":
+                if payload.get("egy") and payload.get("ptn") == proto["energy_pattern"]:
+                    state_data = self._process_energy_data(payload, device_id)
+                    if state_data:
+                        self._handle_state_update(device_id, state_data)
+            elif topic_type == "sys":
+                ptn = payload.get("ptn")
+                if ptn == proto["online_pattern"]:
+                    # Device online/offline notification
+                    is_online = payload.get("online") == "1"
+                    _LOGGER.debug(
+                        "Device %s online status: %s", device_id, is_online
+                    )
+                    self._handle_state_update(
+                        device_id, {"_online": is_online}
+                    )
+                elif ptn == proto["heartbeat_pattern"]:
+                    _LOGGER.debug("Heartbeat received for device %s", device_id)
+            elif topic_type == "res":
+                # Response to an active get/ query (same ENL format as inf/)
+                if payload.get("enl"):
+                    state_data = self._process_device_info(payload)
+                    if state_data:
+                        self._handle_state_update(device_id, state_data)
 
-            subscription = await self._mqtt_client.async_subscribe(topic, message_received)
-            self._mqtt_subscriptions[f"{device_id}_{topic_type}"] = subscription
+        except Exception as err:
+            _LOGGER.error("Error processing MQTT message: %s", err)
 
     def _process_device_info(self, parsed_data: dict[str, Any]) -> dict[str, Any]:
         state_data = {}
@@ -493,18 +549,18 @@ class RinnaiClient:
         return self._process_device_info(parsed_data)
 
     def _process_energy_data(self, parsed_data: dict[str, Any], device_id: str) -> dict[str, Any]:
-        updates = {}
+        updates: dict[str, Any] = {}
         device_config = self._device_configs.get(device_id)
-        
-        energy_keys = []
-        if device_config:
-            energy_keys = device_config.features.get("energy_data_keys", [])
-            
+        if not device_config:
+            return updates
+
+        # Set intersection runs in C; the old list literal walked every key
+        # with a membership probe per egy entry
+        energy_keys = device_config.energy_keys
         for param in parsed_data.get("egy", []):
             if isinstance(param, dict):
-                for key in energy_keys:
-                    if key in param:
-                        updates[key] = param[key]
+                for key in energy_keys & param.keys():
+                    updates[key] = param[key]
         return updates
 
     async def send_command(self, device_id: str, command: dict[str, Any]) -> bool:
@@ -513,31 +569,30 @@ class RinnaiClient:
             if not await self._mqtt_client.async_connect():
                 return False
 
-        if device_id not in self.devices:
+        device_data = self.devices.get(device_id)
+        if device_data is None:
             return False
 
-        device_data = self.devices[device_id]
-        proto = MQTT_DEFINITIONS["protocol"]
-        
-        auth_code = device_data.get("authCode", proto["info_code"])
+        auth_code = device_data.get("authCode", _PROTOCOL["info_code"])
         device_mac = device_data.get("mac")
         if not device_mac:
             return False
 
-        device_classid = device_data.get("classID")
-        set_topic = MQTT_DEFINITIONS["topics"]["set"].format(mac=device_mac)
-        
+        set_topic = self._set_topics.get(device_id)
+        if set_topic is None:
+            set_topic = MQTT_DEFINITIONS["topics"]["set"].format(mac=device_mac)
+            self._set_topics[device_id] = set_topic
+
         rinnai_message = {
+            **_COMMAND_TEMPLATE,
             "code": auth_code,
             "enl": [{"data": str(value), "id": key} for key, value in command.items()],
-            "id": device_classid,
-            "ptn": proto["command_pattern"],
-            "sum": proto["command_sum"],
+            "id": device_data.get("classID"),
         }
 
         try:
             return await self._mqtt_client.async_publish(
-                set_topic, json.dumps(rinnai_message), qos=1
+                set_topic, json.dumps(rinnai_message), qos=COMMAND_QOS
             )
         except Exception as err:
             _LOGGER.error("Error sending MQTT command: %s", err)
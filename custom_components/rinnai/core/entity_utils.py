@@ -93,6 +93,29 @@ def get_state_value(device_state: Any, attribute_key: str, mapping: dict[str, st
         
     return None
 
+
+def make_state_getter(
+    attribute_key: str, mapping: dict[str, str] | None
+) -> Any:
+    """Return a precompiled getter equivalent to get_state_value().
+
+    The state mapping is static per device config, so entities that read the
+    same attribute on every coordinator update can resolve the mapped raw key
+    once instead of per call. The closure keeps get_state_value's fallback
+    behavior for unmapped or legacy attributes.
+    """
+    mapped_key = mapping.get(attribute_key) if mapping else None
+
+    def _get(device_state: Any) -> Any:
+        if not device_state:
+            return None
+        if mapped_key is not None and mapped_key in device_state.raw_data:
+            return device_state.raw_data[mapped_key]
+        return get_state_value(device_state, attribute_key, mapping)
+
+    return _get
+
+
 async def execute_transition(
     coordinator: "RinnaiCoordinator",
     device_id: str,
@@ -105,6 +128,7 @@ async def execute_transition(
         device_id: The device ID.
         steps: List of transition steps. Each step is a dict with 'cmd', 'value', and optional 'delay'.
     """
+    last_idx = len(steps) - 1
     for idx, step in enumerate(steps):
         cmd_key = step.get("cmd")
         cmd_value = step.get("value")
@@ -122,7 +146,9 @@ async def execute_transition(
             _LOGGER.warning("Failed to execute transition step %d: %s", idx + 1, command)
             return False
 
-        if delay > 0:
+        # Step delays exist to space out consecutive commands; sleeping after
+        # the final step would only hold up the caller.
+        if delay > 0 and idx < last_idx:
             await asyncio.sleep(delay)
 
     return True
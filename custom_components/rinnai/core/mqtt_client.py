@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Callable
 import datetime
+from functools import partial
 import logging
 import ssl
 from typing import Any
@@ -28,25 +29,39 @@ class RinnaiMQTTClient:
         self.password = password
         ts = datetime.datetime.now()
         self.client_id = f"{self.username}:{ts.second}{ts.microsecond}"
-        self.client = mqtt.Client(client_id=self.client_id)
+        # clean_session keeps the broker from queuing QoS messages for this
+        # client id between HA restarts (state is re-fetched over HTTP anyway)
+        self.client = mqtt.Client(client_id=self.client_id, clean_session=True)
         self.connected = False
+        self._connected_event = asyncio.Event()
         self._subscribes = {}
-        self._loop_task = None
+        self._misc_task: asyncio.Task | None = None
         self._connect_lock = asyncio.Lock()
         self._reconnect_task: asyncio.Task | None = None
         self._reconnect_attempt = 0
 
         self.client.username_pw_set(self.username, self.password)
-        self.hass.async_add_executor_job(
-            self.client.tls_set,
-            None,  # ca_certs
-            None,  # certfile
-            None,  # keyfile
-            ssl.CERT_NONE,  # cert_reqs
-            ssl.PROTOCOL_TLSv1_2,  # tls_version
-            None,  # ciphers
+        # Keep paho's own retry pacing in line with _RECONNECT_DELAYS in case
+        # its internal reconnect path ever runs
+        self.client.reconnect_delay_set(
+            min_delay=_RECONNECT_DELAYS[0], max_delay=_RECONNECT_DELAYS[-1]
         )
 
+        # Drive paho's network I/O from the HA event loop instead of a
+        # loop_start() thread: the socket callbacks (de)register the socket
+        # with the loop, so every inbound message is handled in-loop with no
+        # GIL round-trip or cross-thread marshalling per message. The socket
+        # callbacks can fire from an executor thread (connect/reconnect run
+        # there), hence call_soon_threadsafe.
+        self.client.on_socket_open = self._on_socket_open
+        self.client.on_socket_close = self._on_socket_close
+        self.client.on_socket_register_write = self._on_socket_register_write
+        self.client.on_socket_unregister_write = self._on_socket_unregister_write
+        # TLS is configured lazily in async_connect: with ca_certs=None,
+        # tls_set loads the system CA bundle from disk, which must not run on
+        # the event loop (__init__ does).
+        self._tls_configured = False
+
         _LOGGER.debug(
             "MQTT client initialized with host=%s, port=%s, username=%s, client_id=%s",
             RINNAI_HOST,
@@ -55,6 +70,36 @@ class RinnaiMQTTClient:
             self.client_id,
         )
 
+    def _on_socket_open(self, client, userdata, sock) -> None:
+        """Register the MQTT socket with the event loop for reads."""
+        self.hass.loop.call_soon_threadsafe(
+            self.hass.loop.add_reader, sock, client.loop_read
+        )
+
+    def _on_socket_close(self, client, userdata, sock) -> None:
+        """Remove the MQTT socket from the event loop."""
+        self.hass.loop.call_soon_threadsafe(self.hass.loop.remove_reader, sock)
+
+    def _on_socket_register_write(self, client, userdata, sock) -> None:
+        """Register the MQTT socket for writes while paho has queued data."""
+        self.hass.loop.call_soon_threadsafe(
+            self.hass.loop.add_writer, sock, client.loop_write
+        )
+
+    def _on_socket_unregister_write(self, client, userdata, sock) -> None:
+        """Stop write polling once paho's output buffer drains."""
+        self.hass.loop.call_soon_threadsafe(self.hass.loop.remove_writer, sock)
+
+    async def _misc_loop(self) -> None:
+        """Run paho's housekeeping (keepalive pings, retries) in-loop."""
+        while self.client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            await asyncio.sleep(1)
+
+    def _ensure_misc_loop(self) -> None:
+        """Start the housekeeping task if it is not already running."""
+        if self._misc_task is None or self._misc_task.done():
+            self._misc_task = self.hass.async_create_task(self._misc_loop())
+
     async def async_connect(self) -> bool:
         """Connect to the Rinnai MQTT broker."""
         async with self._connect_lock:
@@ -68,6 +113,9 @@ class RinnaiMQTTClient:
                     self.connected = True
                     for topic in self._subscribes:
                         client.subscribe(topic)
+                    # Wake waiters immediately instead of letting them poll;
+                    # threadsafe because connect/reconnect run on the executor
+                    self.hass.loop.call_soon_threadsafe(self._connected_event.set)
                     _LOGGER.info("MQTT client connected successfully")
                 else:
                     _LOGGER.error(
@@ -82,6 +130,7 @@ class RinnaiMQTTClient:
                     "Disconnected from Rinnai MQTT broker with result code %s", rc
                 )
                 self.connected = False
+                self.hass.loop.call_soon_threadsafe(self._connected_event.clear)
                 if rc != 0:
                     _LOGGER.warning(
                         "Unexpected disconnection from MQTT broker with code %s: %s",
@@ -91,17 +140,31 @@ class RinnaiMQTTClient:
                     self.hass.loop.call_soon_threadsafe(self._schedule_reconnect)
 
             def on_message(client, userdata, msg):
-                """Handle incoming message."""
-                _LOGGER.debug("Received message on topic %s", msg.topic)
-                if msg.topic in self._subscribes:
-                    callback_func = self._subscribes[msg.topic][0]
-                    self.hass.loop.call_soon_threadsafe(callback_func, msg)
+                """Fallback for messages no per-topic callback claimed."""
+                _LOGGER.debug("Unhandled message on topic %s", msg.topic)
 
             self.client.on_connect = on_connect
             self.client.on_disconnect = on_disconnect
             self.client.on_message = on_message
 
             try:
+                if not self._tls_configured:
+                    # Awaited before the first connect(), so the old
+                    # fire-and-forget race stays fixed; runs in the executor
+                    # because loading the default CA bundle reads from disk
+                    await self.hass.async_add_executor_job(
+                        partial(
+                            self.client.tls_set,
+                            ca_certs=None,
+                            certfile=None,
+                            keyfile=None,
+                            cert_reqs=ssl.CERT_NONE,
+                            tls_version=ssl.PROTOCOL_TLSv1_2,
+                            ciphers=None,
+                        )
+                    )
+                    self._tls_configured = True
+
                 _LOGGER.info(
                     "Connecting to MQTT broker at %s:%s", RINNAI_HOST, RINNAI_PORT
                 )
@@ -109,15 +172,14 @@ class RinnaiMQTTClient:
                     self.client.connect, RINNAI_HOST, RINNAI_PORT, 60
                 )
 
-                self.client.loop_start()
-                _LOGGER.debug("MQTT client loop started")
+                self._ensure_misc_loop()
+                _LOGGER.debug("MQTT network loop attached to event loop")
 
-                for i in range(10):
-                    if self.connected:
-                        break
-                    await asyncio.sleep(0.5)
-                    if i == 9 and not self.connected:
-                        _LOGGER.warning("MQTT connection timeout after 5 seconds")
+                try:
+                    async with asyncio.timeout(5):
+                        await self._connected_event.wait()
+                except TimeoutError:
+                    _LOGGER.warning("MQTT connection timeout after 5 seconds")
 
             except Exception as err:
                 _LOGGER.error("Error connecting to Rinnai MQTT broker: %s", err)
@@ -153,13 +215,15 @@ class RinnaiMQTTClient:
                         self.client.reconnect
                     )
                     # Wait for on_connect to fire
-                    for _ in range(10):
-                        if self.connected:
-                            break
-                        await asyncio.sleep(0.5)
+                    try:
+                        async with asyncio.timeout(5):
+                            await self._connected_event.wait()
+                    except TimeoutError:
+                        pass
 
                 if self.connected:
                     _LOGGER.info("MQTT reconnected successfully")
+                    self._ensure_misc_loop()
                     self._reconnect_attempt = 0
                     return
             except Exception as err:
@@ -170,10 +234,14 @@ class RinnaiMQTTClient:
         if self._reconnect_task and not self._reconnect_task.done():
             self._reconnect_task.cancel()
             self._reconnect_task = None
+        if self._misc_task and not self._misc_task.done():
+            self._misc_task.cancel()
+            self._misc_task = None
         if self.client:
             _LOGGER.info("Disconnecting from MQTT broker")
-            await self.hass.async_add_executor_job(self.client.disconnect)
-            await self.hass.async_add_executor_job(self.client.loop_stop)
+            # Non-blocking with the in-loop network handling: this just queues
+            # the DISCONNECT packet and closes the socket via the callbacks
+            self.client.disconnect()
             self.connected = False
             _LOGGER.debug("MQTT client disconnected and loop stopped")
 
@@ -185,9 +253,9 @@ class RinnaiMQTTClient:
 
         try:
             _LOGGER.debug("Publishing to topic %s: %s", topic, payload)
-            result = await self.hass.async_add_executor_job(
-                self.client.publish, topic, payload, qos
-            )
+            # publish() only queues the packet; the loop's write handler sends
+            # it, so no executor hop is needed
+            result = self.client.publish(topic, payload, qos)
 
         except Exception as err:
             _LOGGER.error("Error publishing to Rinnai MQTT broker: %s", err)
@@ -204,10 +272,16 @@ class RinnaiMQTTClient:
                 return lambda: None
 
         self._subscribes[topic] = (callback_func, qos)
+        # Let paho route the frame straight to this handler instead of going
+        # through on_message plus our own topic dict lookup per message.
+        # loop_read runs on the HA loop, so the callback dispatches directly.
+        self.client.message_callback_add(
+            topic, lambda client, userdata, msg: callback_func(msg)
+        )
         _LOGGER.info("Subscribing to topic %s with QoS %s", topic, qos)
 
         try:
-            await self.hass.async_add_executor_job(self.client.subscribe, topic, qos)
+            self.client.subscribe(topic, qos)
         except Exception as err:
             _LOGGER.error("Error subscribing to topic %s: %s", topic, err)
             return lambda: None
@@ -222,6 +296,7 @@ class RinnaiMQTTClient:
         """Unsubscribe from a topic."""
         if topic in self._subscribes:
             del self._subscribes[topic]
+            self.client.message_callback_remove(topic)
             _LOGGER.info("Unsubscribed from topic %s", topic)
 
         if self.connected:
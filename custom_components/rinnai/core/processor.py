@@ -16,32 +16,64 @@ def processor(func, name: str = None):
     PROCESSORS[name] = func
     return func
 
+# Deletes every hex digit: a non-empty translate() result means garbage.
+# C-level validation up front is cheaper than raising/unwinding ValueError
+# when Rinnai sends a malformed field.
+_NOT_HEX = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+def _hex_str_to_int(value: str) -> int:
+    """Convert a hex string to an integer, logging and returning 0 on garbage."""
+    if not value:
+        return 0
+    if value.translate(_NOT_HEX):
+        _LOGGER.warning("Failed to convert hex value: %s", value)
+        return 0
+    # bytes.fromhex is C-optimized and noticeably faster than
+    # int(s, 16) for the short hex strings Rinnai sends. Fields like
+    # gasConsumption arrive heavily zero-padded, so strip the prefix
+    # before converting instead of materializing all those zero bytes.
+    value = value.lstrip("0") or "0"
+    if len(value) % 2:
+        value = "0" + value
+    return int.from_bytes(bytes.fromhex(value), "big")
+
 @processor
 def hex_to_int(value: Any, *args) -> int:
     """Convert hex string to integer."""
+    # Exact-type checks first: payload values are plain str (or already int),
+    # so the common case skips the slower isinstance protocol entirely
+    cls = type(value)
+    if cls is str:
+        return _hex_str_to_int(value)
+    if cls is int:
+        return value
     if isinstance(value, int):
         return value
     if isinstance(value, str):
-        if not value:
-            return 0
-        try:
-            return int(value, 16)
-        except ValueError:
-            _LOGGER.warning("Failed to convert hex value: %s", value)
-            return 0
+        return _hex_str_to_int(value)
+    return 0
+
+def _hex4_str_to_int(value: str) -> int:
+    """Convert a 4-digit hex string (low byte ignored) to an integer."""
+    if len(value) >= 4:
+        high = value[:-2]
+        if not high.translate(_NOT_HEX):
+            return int(high, 16)
+    _LOGGER.warning("Failed to convert hex4 value: %s", value)
     return 0
 
 @processor
 def hex4_to_int(value: Any, *args) -> int:
     """Convert hex string to integer."""
+    cls = type(value)
+    if cls is str:
+        return _hex4_str_to_int(value)
+    if cls is int:
+        return value
     if isinstance(value, int):
         return value
     if isinstance(value, str):
-        if len(value) >= 4:
-            try:
-                return int(value[:-2], 16)
-            except ValueError:
-                pass
+        return _hex4_str_to_int(value)
     _LOGGER.warning("Failed to convert hex4 value: %s", value)
     return 0
 
@@ -111,19 +143,110 @@ def process_value(value: Any, processor_configs: list[dict[str, Any] | str]) ->
             
     return result
 
-def process_data(raw_data: dict[str, Any], config_processors: dict[str, list[Any]]) -> dict[str, Any]:
-    """Process raw data dictionary based on configuration."""
-    processed_data = {}
-    
-    # First copy all raw data
-    processed_data.update(raw_data)
-    
-    # Apply processors
-    for field, processor_list in config_processors.items():
-        if field in raw_data:
+def _make_runner(
+    chain: tuple[tuple[Callable, tuple], ...]
+) -> Callable[[Any], Any]:
+    """Fold a resolved processor chain into one callable.
+
+    The hot loop then makes a single call per field instead of iterating
+    (func, args) pairs and re-entering the error-handling branch per step.
+    Most configs map a field to exactly one argument-less processor (e.g.
+    hex_to_int), and the registered processors already handle bad input
+    internally, so that case dispatches straight to the function — no
+    wrapper frame, no loop, no redundant try/except.
+    """
+    if len(chain) == 1:
+        func, args = chain[0]
+        if not args:
+            return func
+
+        def _run_one(value: Any) -> Any:
             try:
-                processed_data[field] = process_value(raw_data[field], processor_list)
+                return func(value, *args)
             except Exception as e:
-                _LOGGER.warning("Failed to process field '%s' (value=%r): %s", field, raw_data[field], e)
-            
+                _LOGGER.warning(
+                    "Error in processor '%s' (value=%r): %s",
+                    func.__name__, value, e,
+                )
+                return value
+
+        return _run_one
+
+    def _run(value: Any) -> Any:
+        for processor_func, args in chain:
+            try:
+                value = processor_func(value, *args)
+            except Exception as e:
+                _LOGGER.warning(
+                    "Error in processor '%s' (value=%r): %s",
+                    processor_func.__name__, value, e,
+                )
+        return value
+
+    return _run
+
+
+def compile_processors(
+    config_processors: dict[str, list[Any]]
+) -> dict[str, Callable[[Any], Any]]:
+    """
+    Resolve processor names and arguments once into a flat plan.
+
+    The per-update hot path then intersects the plan's fields with the
+    payload and calls one prebuilt runner closure per match, instead of
+    re-parsing the string/dict config and re-querying PROCESSORS for every
+    field of every payload. Unknown processors are logged once here.
+    """
+    plan: dict[str, Callable[[Any], Any]] = {}
+    for field, processor_list in config_processors.items():
+        chain = []
+        for config in processor_list:
+            func_name = ""
+            args: tuple = ()
+
+            if isinstance(config, str):
+                func_name = config
+            elif isinstance(config, dict):
+                func_name = config.get("func", "")
+                args = tuple(config.get("args", []))
+
+            if processor_func := PROCESSORS.get(func_name):
+                chain.append((processor_func, args))
+            else:
+                _LOGGER.warning("Unknown processor: '%s'", func_name)
+
+        if chain:
+            plan[field] = _make_runner(tuple(chain))
+    return plan
+
+def process_data_into(
+    target: dict[str, Any],
+    raw_data: dict[str, Any],
+    compiled: dict[str, Callable[[Any], Any]],
+) -> None:
+    """
+    Merge raw_data into target, applying a compiled processor plan.
+
+    Unlike process_data this writes processed values straight into target,
+    avoiding an intermediate full copy of the payload on every update.
+    """
+    target.update(raw_data)
+
+    # C-level key intersection: partial MQTT payloads usually match only a
+    # field or two, so don't probe the payload once per plan entry
+    for field in compiled.keys() & raw_data.keys():
+        target[field] = compiled[field](raw_data[field])
+
+def process_data(
+    raw_data: dict[str, Any],
+    config_processors: dict[str, list[Any]],
+    compiled: dict[str, Callable[[Any], Any]] | None = None,
+) -> dict[str, Any]:
+    """Process raw data dictionary based on configuration."""
+    processed_data: dict[str, Any] = {}
+
+    if compiled is None:
+        compiled = compile_processors(config_processors)
+
+    process_data_into(processed_data, raw_data, compiled)
     return processed_data
@@ -5,6 +5,8 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+_OFF_SCHEDULE_STRINGS = frozenset({"off", "none", ""})
+
 def decode_schedule_bitmap(hex_str: str) -> list[int]:
     """Decode a 6-char hex string (3 bytes) into a list of active hours (0-23).
     
@@ -88,7 +90,7 @@ def parse_schedule_string(schedule_str: str) -> str:
     - "off"
     """
     schedule_str = schedule_str.lower().strip()
-    if schedule_str in ["off", "none", ""]:
+    if schedule_str in _OFF_SCHEDULE_STRINGS:
         return "000000"
     if schedule_str == "all":
         return "FFFFFF"
@@ -7,7 +7,6 @@ from typing import Any
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import Entity
 
-from .const import DOMAIN
 from .coordinator import RinnaiCoordinator
 from .core.entity_utils import get_state_value
 from .core.schedule_manager import RinnaiScheduleManager
@@ -29,28 +28,24 @@ class RinnaiEntity(CoordinatorEntity, Entity):
         self._entity_config = entity_config
         self._schedule_manager: RinnaiScheduleManager | None = None
         
-        device = self._device
-        if device:
-            # Unique ID generation
-            # Use the key from config if available, otherwise generate one
-            key = entity_config.get("key", "unknown")
-            self._attr_unique_id = f"{device_id}_{key}"
-            
-            self._attr_has_entity_name = True
-            
-            # Set name if provided in config
-            if name := entity_config.get("name"):
-                self._attr_name = name
-                
-            if translation_key := entity_config.get("key"):
-                self._attr_translation_key = translation_key
-                
-            self._attr_device_info = {
-                "identifiers": {(DOMAIN, device_id)},
-                "name": device.device_name,
-                "manufacturer": "Rinnai",
-                "model": device.device_type,
-            }
+        # Unique ID generation
+        # Use the key from config if available, otherwise generate one
+        # (independent of the device lookup so it survives a missing device)
+        key = entity_config.get("key", "unknown")
+        self._attr_unique_id = f"{device_id}_{key}"
+
+        self._attr_has_entity_name = True
+
+        # Set name if provided in config
+        if name := entity_config.get("name"):
+            self._attr_name = name
+
+        if translation_key := entity_config.get("key"):
+            self._attr_translation_key = translation_key
+
+        if self._device:
+            # Shared per-device dict: all entities of one device are identical
+            self._attr_device_info = coordinator.device_info_for(device_id)
             
     @property
     def _device(self):
@@ -65,7 +60,8 @@ class RinnaiEntity(CoordinatorEntity, Entity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self._device or not self._device.online:
+        device = self._device
+        if not device or not device.online:
             return False
         return super().available
 
@@ -83,10 +79,10 @@ class RinnaiEntity(CoordinatorEntity, Entity):
         device = self._device
         if not device or not device.config:
             return None
-            
+
         return get_state_value(
-            self._device_state, 
-            key, 
+            self._device_state,
+            key,
             device.config.state_mapping
         )
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..core.processor import compile_processors
+
 @dataclass
 class RinnaiDeviceConfig:
     """Rinnai device configuration."""
@@ -21,6 +23,32 @@ class RinnaiDeviceConfig:
     # Schedule configuration
     schedule_config: dict[str, Any] = field(default_factory=dict)
 
+    # Compiled processor plan, built lazily on first use
+    _processor_plan: dict | None = field(default=None, init=False, repr=False)
+    _processor_fields: frozenset[str] | None = field(default=None, init=False, repr=False)
+    _energy_keys: frozenset[str] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def processor_plan(self) -> dict:
+        """Compiled field → runner processor plan for this config."""
+        if self._processor_plan is None:
+            self._processor_plan = compile_processors(self.processors)
+        return self._processor_plan
+
+    @property
+    def processor_fields(self) -> frozenset[str]:
+        """Fields that have a processor chain configured."""
+        if self._processor_fields is None:
+            self._processor_fields = frozenset(self.processors)
+        return self._processor_fields
+
+    @property
+    def energy_keys(self) -> frozenset[str]:
+        """Energy-data field names as a set, for C-level intersection tests."""
+        if self._energy_keys is None:
+            self._energy_keys = frozenset(self.features.get("energy_data_keys", []))
+        return self._energy_keys
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RinnaiDeviceConfig:
         """Create config from dictionary."""
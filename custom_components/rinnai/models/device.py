@@ -9,12 +9,12 @@ from typing import Any
 from ..core.config_manager import config_manager
 from .config import RinnaiDeviceConfig
 from ..core.state_manager import RinnaiStateManager
-from ..core.processor import process_data
+from ..core.processor import process_data_into
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RinnaiDeviceState:
     """Representation of a Rinnai device state with dynamic fields."""
 
@@ -31,16 +31,23 @@ class RinnaiDeviceState:
             self.raw_data.update(api_data)
             return
 
-        # Process data using generic processor
-        processed_data = process_data(api_data, self.config.processors)
-        
-        # Update internal state
-        self.raw_data.update(processed_data)
-        
-        _LOGGER.debug("Updated device state with processed data: %s", processed_data)
+        # Fast path: nothing in this payload has a processor configured, so
+        # skip the processing pass (common for partial MQTT updates)
+        if not self.config.processor_fields & api_data.keys():
+            self.raw_data.update(api_data)
+            return
+
+        # Merge the payload and apply the config's precompiled processor plan
+        # directly into raw_data — no intermediate processed copy
+        process_data_into(self.raw_data, api_data, self.config.processor_plan)
+
+        # Hot path: runs on every MQTT/HTTP update, so skip building the log
+        # call arguments entirely when debug logging is off.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Updated device state from payload: %s", api_data)
 
 
-@dataclass
+@dataclass(slots=True)
 class RinnaiDevice:
     """Representation of a Rinnai device."""
 
@@ -91,7 +91,7 @@ class RinnaiNumberEntity(RinnaiEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Send the new setpoint to the device."""
         int_value = int(value)
-        hex_val = hex(int_value)[2:].upper().zfill(2)
+        hex_val = f"{int_value:02X}"
         if self._temp_format == "hex4":
             hex_val = hex_val + "00"
 
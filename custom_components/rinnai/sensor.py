@@ -20,7 +20,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import CONF_EXPERIMENTAL_SENSORS, DOMAIN
 from .coordinator import RinnaiCoordinator
-from .core.entity_utils import get_hex_byte
+from .core.entity_utils import get_hex_byte, make_state_getter
 from .entity import RinnaiEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -101,6 +101,18 @@ class RinnaiGenericSensor(RinnaiEntity, SensorEntity, RestoreEntity):
             entity_category=EntityCategory(config["entity_category"]) if config.get("entity_category") else None,
         )
         self.entity_description = description
+        # Pre-bind the fields HA re-reads on every state write so the
+        # property lookups stop at the instance instead of falling through
+        # to the entity_description chain
+        self._attr_device_class = description.device_class
+        self._attr_state_class = description.state_class
+        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
+        self._attr_entity_category = description.entity_category
+        # Hoisted off entity_description: read on every update, and each read
+        # would otherwise chain through the dataclass descriptor
+        self._is_cumulative = (
+            description.state_class == SensorStateClass.TOTAL_INCREASING
+        )
         self._value_map = config.get("value_map")
         self._state_attribute = config.get("state_attribute")
         self._fallback_state_attribute = config.get("fallback_state_attribute")
@@ -109,6 +121,25 @@ class RinnaiGenericSensor(RinnaiEntity, SensorEntity, RestoreEntity):
             for value in config.get("fallback_when", ["", "0", "00", "Error", "error"])
         }
         self._restored_native_value = None
+        self._last_written: tuple | None = None
+        self._last_raw_value: Any = object()  # sentinel, never equal to state
+
+        # Precompile the state lookups: the mapping is static per device
+        # config, so resolve the mapped raw keys once instead of per update
+        device = self._device
+        mapping = (
+            device.config.state_mapping if device and device.config else None
+        )
+        self._get_state_value = (
+            make_state_getter(self._state_attribute, mapping)
+            if self._state_attribute
+            else None
+        )
+        self._get_fallback_value = (
+            make_state_getter(self._fallback_state_attribute, mapping)
+            if self._fallback_state_attribute
+            else None
+        )
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -130,36 +161,47 @@ class RinnaiGenericSensor(RinnaiEntity, SensorEntity, RestoreEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle device updates."""
         self._update_attributes()
+        # Only write when the visible state moved; idle devices tick the
+        # coordinator without changing most sensors
+        written = (self.available, self._attr_native_value)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
 
     def _update_attributes(self) -> None:
         """Update sensor attributes based on device state."""
-        if not self._state_attribute:
+        if not self._get_state_value:
             return
 
-        raw_value = self._state_value_with_fallback()
-        
+        # Resolve the state once; the getters carry the precompiled mapping
+        raw_value = self._state_value_with_fallback(self._device_state)
+        if raw_value == self._last_raw_value:
+            # Native value derives solely from raw_value (plus the static
+            # value_map and restore fallback); skip the re-derivation
+            return
+        self._last_raw_value = raw_value
+
         if self._value_map and str(raw_value) in self._value_map:
             current_value = self._value_map[str(raw_value)]
         else:
             current_value = raw_value
             
-        is_cumulative = self.entity_description.state_class == SensorStateClass.TOTAL_INCREASING
-        if (current_value is None or (is_cumulative and current_value == 0)) and self._restored_native_value is not None:
+        if (current_value is None or (self._is_cumulative and current_value == 0)) and self._restored_native_value is not None:
              self._attr_native_value = self._restored_native_value
         else:
              self._attr_native_value = current_value
 
-    def _state_value_with_fallback(self) -> Any:
+    def _state_value_with_fallback(self, state) -> Any:
         """Return the configured state value, applying fallback when needed."""
-        raw_value = self.get_state_value(self._state_attribute)
+        raw_value = self._get_state_value(state)
         if (
-            not self._fallback_state_attribute
+            not self._get_fallback_value
             or str(raw_value) not in self._fallback_when
         ):
             return raw_value
 
-        fallback_value = self.get_state_value(self._fallback_state_attribute)
+        fallback_value = self._get_fallback_value(state)
         if (
             fallback_value is not None
             and str(fallback_value) not in self._fallback_when
@@ -180,10 +222,17 @@ class RinnaiHeatingReservationSensor(RinnaiEntity, SensorEntity):
         self._on_label = config.get("on_label", "On")
         self._off_label = config.get("off_label", "Off")
         self._extra_state_attributes = config.get("extra_state_attributes", {})
+        self._last_written: tuple | None = None
         self._update_attributes()
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        # State and attributes derive solely from the schedule hex; skip the
+        # re-parse and state-machine write when it has not moved
+        written = (self.available, self.get_state_value(self._state_attribute))
+        if written == self._last_written:
+            return
+        self._last_written = written
         self._update_attributes()
         self.async_write_ha_state()
 
@@ -236,6 +285,7 @@ class RinnaiCirculationSensor(RinnaiEntity, SensorEntity):
         self._state_attribute = config["state_attribute"]
         self._byte_index = int(config.get("byte_index", 2))
         self._on_value = str(config.get("on_value", "0C")).upper()
+        self._last_raw_value: Any = object()  # sentinel, never equal to state
         self._update_attributes()
 
     @callback
@@ -245,6 +295,11 @@ class RinnaiCirculationSensor(RinnaiEntity, SensorEntity):
 
     def _update_attributes(self) -> None:
         raw_value = self.get_state_value(self._state_attribute)
+        if raw_value == self._last_raw_value:
+            # Value and attributes derive solely from raw_value; skip the
+            # re-parse and the extra_state_attributes dict reallocation.
+            return
+        self._last_raw_value = raw_value
         byte_value = get_hex_byte(raw_value, self._byte_index)
         if byte_value is None:
             self._attr_native_value = "Unknown"
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.water_heater import (
@@ -25,6 +26,10 @@ from .relative_temperature import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# A UI slider can fire several set_temperature calls per second; commands
+# closer together than this are coalesced into one publish of the last value
+TEMPERATURE_DEBOUNCE = 0.2  # seconds
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -89,21 +94,66 @@ class RinnaiWaterHeaterEntity(RinnaiEntity, WaterHeaterEntity):
         if self._relative_temperature_control:
             self._attr_extra_state_attributes = {}
 
+        # Raw state attributes that feed the written state, for cheap
+        # change detection before recomputing everything
+        self._signature_attrs = tuple(
+            attr
+            for attr in (
+                self._state_attribute,
+                self._min_temp_attribute,
+                self._max_temp_attribute,
+            )
+            if attr
+        )
+        self._last_signature: tuple | None = None
+
+        # Debounce bookkeeping for rapid slider input
+        self._pending_temperature: int | None = None
+        self._temp_flush_handle: asyncio.TimerHandle | None = None
+        self._last_temp_send = 0.0
+
         self._update_attributes()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._update_attributes()
-        self.async_write_ha_state()
+        signature = self._state_signature()
+        if signature is not None and signature == self._last_signature:
+            return
+        self._last_signature = signature
+        if self._update_attributes():
+            self.async_write_ha_state()
+
+    def _state_signature(self) -> tuple | None:
+        """Build a change-detection tuple from the raw device state."""
+        device = self._device
+        if not device:
+            return None
+        # available folds in device.online and super().available, so a failed
+        # or recovered coordinator refresh changes the signature too
+        return (
+            self.available,
+            *(self.get_state_value(attr) for attr in self._signature_attrs),
+        )
+
+    def _visible_attributes(self) -> tuple:
+        """Snapshot the attributes that affect the written state."""
+        return (
+            getattr(self, "_attr_available", None),
+            getattr(self, "_attr_target_temperature", None),
+            getattr(self, "_attr_current_temperature", None),
+            getattr(self, "_attr_min_temp", None),
+            getattr(self, "_attr_max_temp", None),
+        )
 
-    def _update_attributes(self) -> None:
-        """Update entity attributes based on coordinator data."""
+    def _update_attributes(self) -> bool:
+        """Update entity attributes; return True when the visible state changed."""
+        before = self._visible_attributes()
         device = self._device
         if not device:
             self._attr_available = False
-            return
-            
+            return self._visible_attributes() != before
+
         self._attr_available = device.online
 
         self._update_temperature_range()
@@ -118,6 +168,7 @@ class RinnaiWaterHeaterEntity(RinnaiEntity, WaterHeaterEntity):
             )
             self._attr_target_temperature = 0
         self._attr_current_temperature = self._attr_target_temperature
+        return self._visible_attributes() != before
 
     def _update_temperature_range(self) -> None:
         """Update min/max temperature from optional state attributes."""
@@ -184,7 +235,46 @@ class RinnaiWaterHeaterEntity(RinnaiEntity, WaterHeaterEntity):
             await self._async_set_relative_temperature(temperature)
             return
 
-        hex_temperature = hex(temperature)[2:].upper().zfill(2)
+        # Send the first change straight away; anything arriving within the
+        # debounce window only replaces the pending value and is published
+        # once by the trailing flush
+        now = time.monotonic()
+        if (
+            self._pending_temperature is None
+            and now - self._last_temp_send >= TEMPERATURE_DEBOUNCE
+        ):
+            self._last_temp_send = now
+            await self._async_send_temperature(temperature)
+            return
+
+        self._pending_temperature = temperature
+        if self._temp_flush_handle is None:
+            self._temp_flush_handle = self.hass.loop.call_later(
+                TEMPERATURE_DEBOUNCE, self._flush_pending_temperature
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending debounced send; the client may be closing."""
+        if self._temp_flush_handle is not None:
+            self._temp_flush_handle.cancel()
+            self._temp_flush_handle = None
+        self._pending_temperature = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _flush_pending_temperature(self) -> None:
+        """Publish the last temperature requested during the debounce window."""
+        self._temp_flush_handle = None
+        temperature = self._pending_temperature
+        self._pending_temperature = None
+        if temperature is not None:
+            self._last_temp_send = time.monotonic()
+            self.hass.async_create_task(self._async_send_temperature(temperature))
+
+    async def _async_send_temperature(self, temperature: int) -> None:
+        """Encode and publish one temperature command."""
+        # One formatting op instead of hex() + slice + upper + zfill
+        hex_temperature = f"{temperature:02X}"
         if self._temp_format == "hex4":
             hex_temperature = hex_temperature + "00"
         command = {self._command_topic: hex_temperature}
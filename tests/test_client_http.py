@@ -76,13 +76,17 @@ async def test_login_uses_app_user_agent_and_version(client_module):
     session = MagicMock()
     response = MagicMock()
     response.json = AsyncMock(return_value={"success": True, "data": {"token": "token"}})
-    session.get = AsyncMock(return_value=response)
+    # session.get returns an async context manager, like real aiohttp
+    request_ctx = MagicMock()
+    request_ctx.__aenter__ = AsyncMock(return_value=response)
+    request_ctx.__aexit__ = AsyncMock(return_value=False)
+    session.get = MagicMock(return_value=request_ctx)
     client_module.async_get_clientsession = MagicMock(return_value=session)
 
     client = client_module.RinnaiClient(MagicMock(), "user", "password")
 
     assert await client.login() is True
-    request = session.get.await_args
+    request = session.get.call_args
     assert request.kwargs["headers"] == {
         "User-Agent": client_module.API_HEADERS["User-Agent"]
     }
@@ -0,0 +1,233 @@
+"""Tests for the coordinator's debounced energy-data persistence."""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+RINNAI_ROOT = ROOT / "custom_components" / "rinnai"
+
+
+class FakeHandle:
+    """Stand-in for an asyncio TimerHandle that records cancellation."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class FakeLoop:
+    """Event-loop stub recording call_later registrations."""
+
+    def __init__(self) -> None:
+        self.scheduled: list[tuple[float, Any, FakeHandle]] = []
+
+    def call_later(self, delay: float, callback: Any) -> FakeHandle:
+        handle = FakeHandle()
+        self.scheduled.append((delay, callback, handle))
+        return handle
+
+
+def _load_module(name: str, path: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def coordinator_module(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Load the coordinator with lightweight Home Assistant stubs."""
+    for name in list(sys.modules):
+        if name == "custom_components" or name.startswith("custom_components.rinnai"):
+            monkeypatch.delitem(sys.modules, name, raising=False)
+
+    custom_components = ModuleType("custom_components")
+    custom_components.__path__ = [str(ROOT / "custom_components")]
+    rinnai_pkg = ModuleType("custom_components.rinnai")
+    rinnai_pkg.__path__ = [str(RINNAI_ROOT)]
+    core_pkg = ModuleType("custom_components.rinnai.core")
+    core_pkg.__path__ = [str(RINNAI_ROOT / "core")]
+    models_pkg = ModuleType("custom_components.rinnai.models")
+    models_pkg.__path__ = [str(RINNAI_ROOT / "models")]
+
+    monkeypatch.setitem(sys.modules, "custom_components", custom_components)
+    monkeypatch.setitem(sys.modules, "custom_components.rinnai", rinnai_pkg)
+    monkeypatch.setitem(sys.modules, "custom_components.rinnai.core", core_pkg)
+    monkeypatch.setitem(sys.modules, "custom_components.rinnai.models", models_pkg)
+
+    homeassistant = ModuleType("homeassistant")
+    homeassistant.__path__ = []
+    homeassistant_core = ModuleType("homeassistant.core")
+    homeassistant_core.HomeAssistant = object
+    homeassistant_core.callback = lambda func: func
+    homeassistant_exceptions = ModuleType("homeassistant.exceptions")
+
+    class HomeAssistantError(Exception):
+        """Stub Home Assistant error."""
+
+    homeassistant_exceptions.HomeAssistantError = HomeAssistantError
+
+    homeassistant_helpers = ModuleType("homeassistant.helpers")
+    homeassistant_helpers.__path__ = []
+    homeassistant_storage = ModuleType("homeassistant.helpers.storage")
+
+    class Store:
+        """Storage stub recording each payload handed to async_save."""
+
+        def __init__(self, hass: Any, version: int, key: str) -> None:
+            self.saved: list[dict[str, Any]] = []
+
+        async def async_load(self) -> None:
+            return None
+
+        async def async_save(self, data: dict[str, Any]) -> None:
+            # Deep-copy: the coordinator reuses its save dict across calls
+            self.saved.append({key: dict(value) for key, value in data.items()})
+
+    homeassistant_storage.Store = Store
+
+    homeassistant_update_coordinator = ModuleType(
+        "homeassistant.helpers.update_coordinator"
+    )
+
+    class DataUpdateCoordinator:
+        def __init__(
+            self,
+            hass: Any,
+            logger: Any,
+            name: str | None = None,
+            update_interval: Any = None,
+            always_update: bool = True,
+        ) -> None:
+            self.hass = hass
+            self.name = name
+            self.update_interval = update_interval
+            self.last_update_success = True
+            self.shutdown_called = False
+
+        async def async_shutdown(self) -> None:
+            self.shutdown_called = True
+
+    homeassistant_update_coordinator.DataUpdateCoordinator = DataUpdateCoordinator
+
+    homeassistant_util = ModuleType("homeassistant.util")
+    homeassistant_util.dt = ModuleType("homeassistant.util.dt")
+
+    monkeypatch.setitem(sys.modules, "homeassistant", homeassistant)
+    monkeypatch.setitem(sys.modules, "homeassistant.core", homeassistant_core)
+    monkeypatch.setitem(sys.modules, "homeassistant.exceptions", homeassistant_exceptions)
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers", homeassistant_helpers)
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers.storage", homeassistant_storage)
+    monkeypatch.setitem(
+        sys.modules,
+        "homeassistant.helpers.update_coordinator",
+        homeassistant_update_coordinator,
+    )
+    monkeypatch.setitem(sys.modules, "homeassistant.util", homeassistant_util)
+
+    client_mod = ModuleType("custom_components.rinnai.core.client")
+    client_mod.RinnaiClient = object
+    monkeypatch.setitem(sys.modules, "custom_components.rinnai.core.client", client_mod)
+
+    device_mod = ModuleType("custom_components.rinnai.models.device")
+    device_mod.RinnaiDevice = object
+    device_mod.RinnaiDeviceState = object
+    monkeypatch.setitem(sys.modules, "custom_components.rinnai.models.device", device_mod)
+
+    _load_module("custom_components.rinnai.const", RINNAI_ROOT / "const.py", monkeypatch)
+    _load_module(
+        "custom_components.rinnai.core.entity_utils",
+        RINNAI_ROOT / "core" / "entity_utils.py",
+        monkeypatch,
+    )
+    return _load_module(
+        "custom_components.rinnai.coordinator",
+        RINNAI_ROOT / "coordinator.py",
+        monkeypatch,
+    )
+
+
+def _make_coordinator(module: ModuleType) -> tuple[Any, Any, list[Any]]:
+    tasks: list[Any] = []
+    hass = SimpleNamespace(loop=FakeLoop(), create_task=tasks.append)
+    client = SimpleNamespace(devices={}, device_states={})
+    coordinator = module.RinnaiCoordinator(hass=hass, client=client)
+    coordinator._devices["dev1"] = SimpleNamespace(
+        config=SimpleNamespace(energy_keys=frozenset({"gasConsumption"})),
+        state=SimpleNamespace(raw_data={"gasConsumption": 1.0}),
+    )
+    return coordinator, hass, tasks
+
+
+def test_repeated_updates_arm_single_save_timer(coordinator_module: ModuleType) -> None:
+    """Chatty updates inside the window must not stack save timers."""
+    coordinator, hass, _ = _make_coordinator(coordinator_module)
+
+    coordinator._schedule_save_energy_data()
+    coordinator._schedule_save_energy_data()
+    coordinator._schedule_save_energy_data()
+
+    assert len(hass.loop.scheduled) == 1
+    assert hass.loop.scheduled[0][0] == coordinator_module.ENERGY_SAVE_DEBOUNCE
+
+
+@pytest.mark.asyncio
+async def test_debounce_timer_fires_one_save(coordinator_module: ModuleType) -> None:
+    """The armed timer performs one save and releases the handle."""
+    coordinator, hass, tasks = _make_coordinator(coordinator_module)
+    coordinator._schedule_save_energy_data()
+    coordinator._schedule_save_energy_data()
+
+    _delay, fire, _handle = hass.loop.scheduled[0]
+    fire()
+
+    assert len(tasks) == 1
+    await tasks[0]
+
+    assert coordinator._store.saved == [{"dev1": {"gasConsumption": 1.0}}]
+    # The handle is released so a later update arms a fresh timer
+    assert coordinator._energy_save_handle is None
+    coordinator._schedule_save_energy_data()
+    assert len(hass.loop.scheduled) == 2
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_timer_and_flushes_save(
+    coordinator_module: ModuleType,
+) -> None:
+    """A save pending in the debounce window survives shutdown."""
+    coordinator, hass, tasks = _make_coordinator(coordinator_module)
+    coordinator._schedule_save_energy_data()
+    handle = hass.loop.scheduled[0][2]
+
+    await coordinator.async_shutdown()
+
+    assert handle.cancelled
+    assert coordinator._energy_save_handle is None
+    assert coordinator._store.saved == [{"dev1": {"gasConsumption": 1.0}}]
+    assert coordinator.shutdown_called
+    # Flushed inline, not via a task the loop may never run again
+    assert tasks == []
+
+
+@pytest.mark.asyncio
+async def test_shutdown_without_pending_save_writes_nothing(
+    coordinator_module: ModuleType,
+) -> None:
+    """Shutdown with no armed timer must not touch the store."""
+    coordinator, _hass, _tasks = _make_coordinator(coordinator_module)
+
+    await coordinator.async_shutdown()
+
+    assert coordinator._store.saved == []
+    assert coordinator.shutdown_called
@@ -1,6 +1,7 @@
 """Tests for config-driven entity command behavior."""
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import sys
@@ -46,6 +47,9 @@ def _install_homeassistant_stubs(monkeypatch: pytest.MonkeyPatch) -> None:
         def available(self) -> bool:
             return True
 
+        async def async_will_remove_from_hass(self) -> None:
+            return None
+
         def async_write_ha_state(self) -> None:
             self._write_count = getattr(self, "_write_count", 0) + 1
             self._written_operations = getattr(self, "_written_operations", [])
@@ -245,6 +249,9 @@ class StubCoordinator:
     def get_device(self, device_id: str) -> Any:
         return self.device
 
+    def device_info_for(self, device_id: str) -> dict[str, Any]:
+        return {"identifiers": {("rinnai", device_id)}}
+
     def get_device_state(self, device_id: str) -> Any:
         return self.state
 
@@ -498,6 +505,82 @@ async def test_direct_temperature_path_unchanged_for_hex4(
     assert coordinator.refresh_count == 0
 
 
+def _direct_water_heater_config() -> dict[str, Any]:
+    return {
+        "name": "Water Heater",
+        "key": "main",
+        "min_temp": 35,
+        "max_temp": 65,
+        "step": 1,
+        "command_topic": "hotWaterTempSetting",
+        "state_attribute": "hot_water_temp",
+        "operation_mode": "Hot Water",
+    }
+
+
+def _attach_loop(entity: Any) -> None:
+    """Give the entity the hass loop/task surface the debounce path uses."""
+    loop = asyncio.get_running_loop()
+    entity.hass = SimpleNamespace(loop=loop, async_create_task=loop.create_task)
+
+
+@pytest.mark.asyncio
+async def test_rapid_temperature_calls_coalesce_to_one_trailing_publish(
+    entity_modules: SimpleNamespace,
+) -> None:
+    config = _direct_water_heater_config()
+    coordinator = StubCoordinator(
+        {"hotWaterTempSetting": 40},
+        {"hot_water_temp": "hotWaterTempSetting"},
+    )
+    entity = entity_modules.water_heater.RinnaiWaterHeaterEntity(coordinator, "dev1", config)
+    _attach_loop(entity)
+
+    await entity.async_set_temperature(temperature=41)
+    await entity.async_set_temperature(temperature=42)
+    await entity.async_set_temperature(temperature=43)
+
+    # Leading edge publishes immediately; the rest land in the debounce window
+    assert coordinator.commands == [{"hotWaterTempSetting": "29"}]
+    assert entity._pending_temperature == 43
+
+    await asyncio.sleep(entity_modules.water_heater.TEMPERATURE_DEBOUNCE + 0.05)
+
+    # The trailing flush publishes only the last requested value
+    assert coordinator.commands == [
+        {"hotWaterTempSetting": "29"},
+        {"hotWaterTempSetting": "2B"},
+    ]
+    assert entity._pending_temperature is None
+    assert entity._temp_flush_handle is None
+
+
+@pytest.mark.asyncio
+async def test_removal_cancels_pending_temperature_flush(
+    entity_modules: SimpleNamespace,
+) -> None:
+    config = _direct_water_heater_config()
+    coordinator = StubCoordinator(
+        {"hotWaterTempSetting": 40},
+        {"hot_water_temp": "hotWaterTempSetting"},
+    )
+    entity = entity_modules.water_heater.RinnaiWaterHeaterEntity(coordinator, "dev1", config)
+    _attach_loop(entity)
+
+    await entity.async_set_temperature(temperature=41)
+    await entity.async_set_temperature(temperature=42)
+    assert entity._pending_temperature == 42
+
+    await entity.async_will_remove_from_hass()
+
+    assert entity._temp_flush_handle is None
+    assert entity._pending_temperature is None
+
+    # The cancelled flush must not publish after removal
+    await asyncio.sleep(entity_modules.water_heater.TEMPERATURE_DEBOUNCE + 0.05)
+    assert coordinator.commands == [{"hotWaterTempSetting": "29"}]
+
+
 @pytest.mark.asyncio
 async def test_e51_water_heater_uses_dynamic_temperature_bounds(
     entity_modules: SimpleNamespace,
@@ -14,6 +14,8 @@ from processor import (
     to_type,
     process_value,
     process_data,
+    compile_processors,
+    process_data_into,
 )
 
 
@@ -43,6 +45,26 @@ class TestHexToInt:
         assert hex_to_int("xyz") == 0
         assert hex_to_int("GG") == 0
 
+    def test_prefixed_hex_rejected(self):
+        """A '0x' prefix is not valid in device payloads."""
+        assert hex_to_int("0x28") == 0
+
+    def test_odd_length_input(self):
+        """Odd-length hex strings are padded, not rejected."""
+        assert hex_to_int("5") == 5
+        assert hex_to_int("1A4") == 420
+
+    def test_zero_padded_input(self):
+        """Heavily zero-padded values (e.g. gasConsumption) convert correctly."""
+        assert hex_to_int("0000000000002710") == 10000
+        assert hex_to_int("0005") == 5
+
+    def test_all_zeros(self):
+        """All-zero strings of any length convert to 0."""
+        assert hex_to_int("0") == 0
+        assert hex_to_int("0000") == 0
+        assert hex_to_int("00000000") == 0
+
     def test_none_value(self):
         """Test None returns 0."""
         assert hex_to_int(None) == 0
@@ -73,6 +95,15 @@ class TestHex4ToInt:
     def test_invalid_hex_returns_zero(self):
         assert hex4_to_int("XXXX") == 0
 
+    def test_malformed_high_byte_returns_zero(self):
+        """Only the high bytes are converted, so garbage there is rejected."""
+        assert hex4_to_int("XX00") == 0
+        assert hex4_to_int("2G00") == 0
+
+    def test_longer_input_uses_all_high_bytes(self):
+        """Values longer than 4 chars drop only the low byte."""
+        assert hex4_to_int("012C00") == 300
+
 
 class TestMultiply:
     """Tests for multiply function."""
@@ -176,6 +207,71 @@ class TestProcessValue:
         assert result == "test"
 
 
+class TestCompileProcessors:
+    """Tests for the compiled processor plan."""
+
+    def test_single_processor_runner(self):
+        """A name-only chain compiles to a callable applying that processor."""
+        plan = compile_processors({"temp": ["hex_to_int"]})
+        assert plan["temp"]("28") == 40
+
+    def test_processor_with_args_runner(self):
+        """Argument-carrying chains keep their bound arguments."""
+        plan = compile_processors({"usage": [{"func": "divide", "args": [10]}]})
+        assert plan["usage"](100) == 10.0
+
+    def test_chained_runner(self):
+        """Multi-step chains apply in order."""
+        plan = compile_processors({
+            "gas": ["hex_to_int", {"func": "divide", "args": [10000]}],
+        })
+        assert plan["gas"]("00002710") == 1.0
+
+    def test_unknown_processor_dropped(self):
+        """Unknown processor names are dropped from the plan."""
+        plan = compile_processors({"temp": ["no_such_processor"]})
+        assert "temp" not in plan
+
+    def test_empty_chain_dropped(self):
+        """Fields with no resolvable processors get no plan entry."""
+        plan = compile_processors({"temp": []})
+        assert plan == {}
+
+
+class TestProcessDataInto:
+    """Tests for in-place processing against a compiled plan."""
+
+    def test_processes_matching_fields_into_target(self):
+        """Processed values land in the target alongside raw fields."""
+        plan = compile_processors({"temp": ["hex_to_int"]})
+        target = {}
+
+        process_data_into(target, {"temp": "28", "status": "on"}, plan)
+
+        assert target == {"temp": 40, "status": "on"}
+
+    def test_preserves_existing_target_fields(self):
+        """Fields absent from the payload keep their previous value."""
+        plan = compile_processors({"temp": ["hex_to_int"]})
+        target = {"temp": 38, "mode": "heat"}
+
+        process_data_into(target, {"temp": "28"}, plan)
+
+        assert target == {"temp": 40, "mode": "heat"}
+
+    def test_plan_fields_missing_from_payload_ignored(self):
+        """Only fields actually present in the payload are processed."""
+        plan = compile_processors({
+            "temp": ["hex_to_int"],
+            "gas": ["hex_to_int"],
+        })
+        target = {}
+
+        process_data_into(target, {"temp": "28"}, plan)
+
+        assert target == {"temp": 40}
+
+
 class TestProcessData:
     """Tests for process_data function."""
 